@@ -1,5 +1,12 @@
+import copy
+import os
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from ..entities.models import Song, Artist, Album, Playlist
 
 class MusicRepository(ABC):
@@ -15,6 +22,10 @@ class MusicRepository(ABC):
     def get_artist_details(self, channel_id: str) -> Dict[str, Any]:
         pass
 
+    @abstractmethod
+    def get_artist_releases(self, channel_id: str) -> Dict[str, Any]:
+        pass
+
     @abstractmethod
     def get_album_details(self, browse_id: str) -> Dict[str, Any]:
         pass
@@ -39,21 +50,190 @@ class MusicRepository(ABC):
     def get_downloaded_songs(self) -> List[Dict[str, Any]]:
         pass
 
+# Upper bound on parallel album fetches, whatever the caller asks for.
+MAX_DISCOGRAPHY_WORKERS = 8
+# Track-detail prefetch limits: queued lookups and cached entries.
+MAX_PREFETCH_QUEUE = 50
+SONG_CACHE_SIZE = 256
+SONG_CACHE_TTL = 600
+# Placeholder repositories put in 'lyrics' when the lyrics lookup itself failed.
+LYRICS_FETCH_FAILED = 'Lyrics fetch failed or unavailable'
+
 class MusicService:
-    def __init__(self, repository: MusicRepository):
+    def __init__(self, repository: MusicRepository, prefetch_tracks: bool = False, prefetch_workers: int = 2):
         self.repository = repository
+        self.prefetch_tracks = prefetch_tracks
+        self.prefetch_workers = max(1, prefetch_workers)
+        self._song_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._prefetching: set = set()
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._prefetch_threads: List[threading.Thread] = []
+
+    @classmethod
+    def from_env(cls, repository: MusicRepository) -> 'MusicService':
+        prefetch = os.getenv('MUSIC_PREFETCH_TRACKS', '').lower() in ('1', 'true', 'yes')
+        return cls(repository, prefetch_tracks=prefetch)
 
     def search_music(self, query: str, limit: int = 10, filter_type: str = 'songs') -> List[Dict[str, Any]]:
         return self.repository.search(query, limit, filter_type)
 
     def get_song_details(self, video_id: str) -> Dict[str, Any]:
-        return self.repository.get_song_details(video_id)
+        if not self.prefetch_tracks:
+            return self.repository.get_song_details(video_id)
+        cached = self._get_cached_song(video_id)
+        if cached is not None:
+            return cached
+        details = self.repository.get_song_details(video_id)
+        # Only complete lookups are cached; a failed lyrics fetch is retried next time.
+        if 'error' not in details and details.get('lyrics') != LYRICS_FETCH_FAILED:
+            with self._prefetch_lock:
+                self._song_cache[video_id] = (time.monotonic(), copy.deepcopy(details))
+                self._song_cache.move_to_end(video_id)
+                while len(self._song_cache) > SONG_CACHE_SIZE:
+                    self._song_cache.popitem(last=False)
+        return details
 
     def get_artist_details(self, channel_id: str) -> Dict[str, Any]:
         return self.repository.get_artist_details(channel_id)
 
     def get_album_details(self, browse_id: str) -> Dict[str, Any]:
-        return self.repository.get_album_details(browse_id)
+        album = self.repository.get_album_details(browse_id)
+        if self.prefetch_tracks and 'error' not in album:
+            self._prefetch_song_details(track.get('video_id') for track in album.get('tracks', []))
+        return album
+
+    def iter_artist_discography(self, channel_id: str, max_workers: int = 4) -> Iterator[Dict[str, Any]]:
+        """Yield the artist's releases first, then each album with its tracks as it is fetched."""
+        releases = self.repository.get_artist_releases(channel_id)
+        if 'error' in releases:
+            yield {'type': 'error', **releases}
+            return
+
+        targets = [
+            (kind, position, item)
+            for kind, key in [('album', 'albums'), ('single', 'singles')]
+            for position, item in enumerate(releases.get(key, []))
+        ]
+        yield {
+            'type': 'artist',
+            'channel_id': channel_id,
+            'name': releases.get('name', 'Unknown'),
+            'album_count': len(releases.get('albums', [])),
+            'single_count': len(releases.get('singles', [])),
+        }
+
+        executor = ThreadPoolExecutor(max_workers=min(max(1, max_workers), MAX_DISCOGRAPHY_WORKERS))
+        futures = {
+            executor.submit(self.repository.get_album_details, item['browse_id']): (kind, position, item)
+            for kind, position, item in targets
+        }
+        try:
+            for future in as_completed(futures):
+                kind, position, item = futures[future]
+                try:
+                    album = future.result()
+                except Exception as e:
+                    yield {'type': kind, 'position': position, 'browse_id': item['browse_id'], 'error': str(e)}
+                    continue
+                yield {
+                    **album,
+                    'type': kind,
+                    'position': position,
+                    'browse_id': item['browse_id'],
+                    'title': album.get('title') or item.get('title', 'Unknown'),
+                    'year': album.get('year') or item.get('year', 'Unknown'),
+                }
+        finally:
+            # Stop queued fetches if the consumer stops reading early.
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def get_artist_discography(self, channel_id: str, max_workers: int = 4) -> Dict[str, Any]:
+        discography: Dict[str, Any] = {'albums': [], 'singles': []}
+        for entry in self.iter_artist_discography(channel_id, max_workers):
+            kind = entry.pop('type')
+            if kind == 'error':
+                return entry
+            if kind == 'artist':
+                discography.update(entry)
+            else:
+                discography[f'{kind}s'].append(entry)
+        for kind in ['albums', 'singles']:
+            discography[kind].sort(key=lambda entry: entry['position'])
+            for entry in discography[kind]:
+                del entry['position']
+        return discography
+
+    def shutdown(self) -> None:
+        """Drop queued track prefetches and stop the prefetch workers once they are idle."""
+        with self._prefetch_lock:
+            self._prefetching.clear()
+            pending, self._prefetch_queue = self._prefetch_queue, queue.Queue()
+            threads, self._prefetch_threads = self._prefetch_threads, []
+        while True:
+            try:
+                pending.get_nowait()
+            except queue.Empty:
+                break
+        for _ in threads:
+            pending.put(None)
+
+    def _fresh_cache_entry(self, video_id: str) -> Optional[Dict[str, Any]]:
+        # Callers must hold _prefetch_lock.
+        entry = self._song_cache.get(video_id)
+        if entry is None:
+            return None
+        fetched_at, details = entry
+        if time.monotonic() - fetched_at > SONG_CACHE_TTL:
+            del self._song_cache[video_id]
+            return None
+        return details
+
+    def _get_cached_song(self, video_id: str) -> Optional[Dict[str, Any]]:
+        with self._prefetch_lock:
+            details = self._fresh_cache_entry(video_id)
+            if details is None:
+                return None
+            self._song_cache.move_to_end(video_id)
+            return copy.deepcopy(details)
+
+    def _prefetch_song_details(self, video_ids) -> None:
+        with self._prefetch_lock:
+            if not self._prefetch_threads:
+                # Daemon workers, so warming the cache never holds up interpreter exit.
+                self._prefetch_threads = [
+                    threading.Thread(
+                        target=self._prefetch_worker,
+                        args=(self._prefetch_queue,),
+                        name=f'track-prefetch-{n}',
+                        daemon=True,
+                    )
+                    for n in range(self.prefetch_workers)
+                ]
+                for thread in self._prefetch_threads:
+                    thread.start()
+            for video_id in video_ids:
+                if len(self._prefetching) >= MAX_PREFETCH_QUEUE:
+                    break
+                if not video_id or video_id in self._prefetching or self._fresh_cache_entry(video_id) is not None:
+                    continue
+                self._prefetching.add(video_id)
+                self._prefetch_queue.put(video_id)
+
+    def _prefetch_worker(self, work: "queue.Queue[Optional[str]]") -> None:
+        while True:
+            video_id = work.get()
+            if video_id is None:
+                return
+            try:
+                self.get_song_details(video_id)
+            except Exception:
+                pass
+            finally:
+                with self._prefetch_lock:
+                    self._prefetching.discard(video_id)
 
     def get_lyrics(self, video_id: str) -> Dict[str, Any]:
         return self.repository.get_lyrics(video_id)
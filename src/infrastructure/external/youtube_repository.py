@@ -7,7 +7,7 @@ import ytmusicapi
 from pytube import YouTube
 from pytube.exceptions import VideoUnavailable, RegexMatchError
 
-from ...core.use_cases.music import MusicRepository
+from ...core.use_cases.music import MusicRepository, LYRICS_FETCH_FAILED
 
 class YouTubeRepository(MusicRepository):
     def __init__(self):
@@ -90,7 +90,7 @@ class YouTubeRepository(MusicRepository):
                     lyrics_data = self.ytmusic.get_lyrics(lyrics_id)
                     details['lyrics'] = lyrics_data.get('lyrics', 'No lyrics available')
             except Exception:
-                details['lyrics'] = 'Lyrics fetch failed or unavailable'
+                details['lyrics'] = LYRICS_FETCH_FAILED
                 
             return details
         except Exception as e:
@@ -112,6 +112,31 @@ class YouTubeRepository(MusicRepository):
         except Exception as e:
             return {'error': f'Failed to get artist details: {str(e)}'}
 
+    def get_artist_releases(self, channel_id: str) -> Dict[str, Any]:
+        try:
+            artist = self.ytmusic.get_artist(channel_id)
+            releases = {'name': artist.get('name', 'Unknown')}
+            for kind in ['albums', 'singles']:
+                section = artist.get(kind, {})
+                items = section.get('results', [])
+                # The artist page only carries a preview; follow the section's
+                # browse ID to get the complete list when there is one.
+                if section.get('browseId') and section.get('params'):
+                    items = self.ytmusic.get_artist_albums(section['browseId'], section['params'])
+                releases[kind] = [
+                    {
+                        'title': item.get('title', 'Unknown'),
+                        'year': item.get('year', 'Unknown'),
+                        'browse_id': item.get('browseId', ''),
+                        'thumbnail': (item.get('thumbnails') or [{}])[-1].get('url', ''),
+                    }
+                    for item in items
+                    if item.get('browseId')
+                ]
+            return releases
+        except Exception as e:
+            return {'error': f'Failed to get artist releases: {str(e)}'}
+
     def get_album_details(self, browse_id: str) -> Dict[str, Any]:
         try:
             album = self.ytmusic.get_album(browse_id)
@@ -15,7 +15,7 @@ from ...infrastructure.database.postgres_repository import PostgresRepository
 
 # Initialize services
 music_repo = YouTubeRepository()
-music_service = MusicService(music_repo)
+music_service = MusicService.from_env(music_repo)
 db_repo = PostgresRepository()
 
 # Create the MCP server
@@ -143,6 +143,23 @@ async def list_tools() -> List[Tool]:
                 "required": ["browse_id"],
             },
         ),
+        Tool(
+            name="youtube_get_artist_discography",
+            description="Get an artist's full discography with the tracks of every album and single",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "channel_id": {"type": "string", "description": "Artist Channel ID"},
+                    "max_workers": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": 8,
+                        "description": "Albums fetched in parallel (default: 4)",
+                    },
+                },
+                "required": ["channel_id"],
+            },
+        ),
         Tool(
             name="youtube_get_lyrics",
             description="Get lyrics for a song",
@@ -247,6 +264,15 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             details = music_service.get_album_details(arguments.get("browse_id", ""))
             return [TextContent(type="text", text=f"Details: {json.dumps(details, indent=2, default=str)}")]
             
+        elif name == "youtube_get_artist_discography":
+            max_workers = arguments.get("max_workers")
+            discography = await asyncio.to_thread(
+                music_service.get_artist_discography,
+                arguments.get("channel_id", ""),
+                4 if max_workers is None else int(max_workers),
+            )
+            return [TextContent(type="text", text=f"Discography: {json.dumps(discography, indent=2, default=str)}")]
+            
         elif name == "youtube_get_lyrics":
             lyrics = music_service.get_lyrics(arguments.get("video_id", ""))
             return [TextContent(type="text", text=f"Lyrics: {json.dumps(lyrics, indent=2, default=str)}")]
@@ -1,5 +1,6 @@
-from flask import Flask, render_template_string, request, jsonify
+from flask import Flask, Response, render_template_string, request, jsonify
 from datetime import datetime
+from itertools import chain
 import json
 
 from ...core.use_cases.music import MusicService
@@ -10,7 +11,7 @@ app = Flask(__name__)
 
 # Initialize services
 music_repo = YouTubeRepository()
-music_service = MusicService(music_repo)
+music_service = MusicService.from_env(music_repo)
 db_repo = PostgresRepository()
 
 # HTML Template (Simplified for brevity, same as before)
@@ -75,5 +76,20 @@ def search():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/artists/<channel_id>/discography')
+def artist_discography(channel_id):
+    try:
+        max_workers = int(request.args.get('max_workers', 4))
+        entries = music_service.iter_artist_discography(channel_id, max_workers)
+        # The artist lookup runs here so a failure gets a proper status code.
+        first = next(entries)
+        if first['type'] == 'error':
+            return jsonify({'error': first['error']}), 500
+        # One JSON object per line, sent as soon as each album is fetched.
+        lines = (json.dumps(entry, default=str) + '\n' for entry in chain([first], entries))
+        return Response(lines, mimetype='application/x-ndjson')
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 def run_app():
     app.run(host='0.0.0.0', port=5000, debug=True)
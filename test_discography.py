@@ -0,0 +1,214 @@
+import threading
+import time
+
+from src.core.use_cases import music
+from src.core.use_cases.music import MusicService, MusicRepository
+
+
+class StubRepository(MusicRepository):
+    """In-memory repository with controllable delays and call counters."""
+
+    def __init__(self, albums=6, singles=2, album_delay=0.0, song_delay=0.0, gate=None):
+        self.albums = [{'title': f'Album {i}', 'browse_id': f'a{i}', 'year': '2000'} for i in range(albums)]
+        self.singles = [{'title': f'Single {i}', 'browse_id': f's{i}', 'year': '2001'} for i in range(singles)]
+        self.album_delay = album_delay
+        self.song_delay = song_delay
+        self.gate = gate
+        self.album_calls = []
+        self.song_calls = []
+        self.lock = threading.Lock()
+
+    def search(self, query, limit, filter_type):
+        return []
+
+    def get_song_details(self, video_id):
+        with self.lock:
+            self.song_calls.append(video_id)
+        if self.gate is not None:
+            self.gate.wait()
+        time.sleep(self.song_delay)
+        return {'video_id': video_id, 'views': len(self.song_calls)}
+
+    def get_artist_details(self, channel_id):
+        return {}
+
+    def get_artist_releases(self, channel_id):
+        if channel_id == 'missing':
+            return {'error': 'Failed to get artist releases: not found'}
+        return {'name': 'Stub Artist', 'albums': self.albums, 'singles': self.singles}
+
+    def get_album_details(self, browse_id):
+        with self.lock:
+            self.album_calls.append(browse_id)
+        # Reverse the completion order so reassembly has to sort.
+        time.sleep(self.album_delay * (10 - int(browse_id[1:])))
+        return {
+            'title': f'Album {browse_id}',
+            'year': '',
+            'tracks': [{'video_id': f'{browse_id}-t{n}'} for n in range(3)],
+        }
+
+    def get_lyrics(self, video_id):
+        return {}
+
+    def get_trending(self, limit):
+        return []
+
+    def get_recommendations(self, video_id, limit):
+        return []
+
+    def download_song(self, video_id, filename=None):
+        return {}
+
+    def get_downloaded_songs(self):
+        return []
+
+
+def wait_for_prefetch(service, timeout=2):
+    deadline = time.monotonic() + timeout
+    while service._prefetching and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_discography_keeps_release_order():
+    service = MusicService(StubRepository(album_delay=0.01))
+    discography = service.get_artist_discography('artist', max_workers=4)
+
+    assert discography['name'] == 'Stub Artist'
+    assert [a['browse_id'] for a in discography['albums']] == [f'a{i}' for i in range(6)]
+    assert [s['browse_id'] for s in discography['singles']] == ['s0', 's1']
+    assert all('position' not in entry for entry in discography['albums'] + discography['singles'])
+    # An empty album year falls back to the release list.
+    assert all(a['year'] == '2000' for a in discography['albums'])
+    assert all(len(a['tracks']) == 3 for a in discography['albums'])
+
+
+def test_discography_error_is_returned():
+    service = MusicService(StubRepository())
+    assert service.get_artist_discography('missing') == {'error': 'Failed to get artist releases: not found'}
+
+
+def test_failed_album_fetch_is_streamed():
+    repo = StubRepository(albums=2, singles=0)
+    original = repo.get_album_details
+
+    def flaky_album_details(browse_id):
+        if browse_id == 'a1':
+            raise RuntimeError('boom')
+        return original(browse_id)
+
+    repo.get_album_details = flaky_album_details
+    entries = list(MusicService(repo).iter_artist_discography('artist'))
+    failed = [entry for entry in entries if entry.get('browse_id') == 'a1']
+    assert failed == [{'type': 'album', 'position': 1, 'browse_id': 'a1', 'error': 'boom'}]
+    assert len(entries) == 3
+
+
+def test_discography_workers_are_capped():
+    service = MusicService(StubRepository())
+    seen = []
+    original = music.ThreadPoolExecutor
+
+    def recording_executor(max_workers=None, **kwargs):
+        seen.append(max_workers)
+        return original(max_workers=max_workers, **kwargs)
+
+    music.ThreadPoolExecutor = recording_executor
+    try:
+        service.get_artist_discography('artist', max_workers=5000)
+        service.get_artist_discography('artist', max_workers=0)
+    finally:
+        music.ThreadPoolExecutor = original
+    assert seen == [music.MAX_DISCOGRAPHY_WORKERS, 1]
+
+
+def test_closing_stream_cancels_queued_fetches():
+    repo = StubRepository(albums=8, singles=0, album_delay=0.005)
+    service = MusicService(repo)
+    entries = service.iter_artist_discography('artist', max_workers=1)
+    assert next(entries)['type'] == 'artist'
+    next(entries)
+    entries.close()
+    time.sleep(0.2)
+    assert len(repo.album_calls) < 8
+
+
+def test_cache_disabled_without_prefetch():
+    repo = StubRepository()
+    service = MusicService(repo)
+    service.get_song_details('v1')
+    service.get_song_details('v1')
+    assert repo.song_calls == ['v1', 'v1']
+
+
+def test_prefetch_deduplicates_and_warms_cache():
+    gate = threading.Event()
+    repo = StubRepository(gate=gate)
+    service = MusicService(repo, prefetch_tracks=True)
+    try:
+        service.get_album_details('a0')
+        service.get_album_details('a0')
+        gate.set()
+        wait_for_prefetch(service)
+        assert sorted(repo.song_calls) == ['a0-t0', 'a0-t1', 'a0-t2']
+        service.get_song_details('a0-t1')
+        assert len(repo.song_calls) == 3
+    finally:
+        gate.set()
+        service.shutdown()
+
+
+def test_prefetch_queue_is_bounded():
+    gate = threading.Event()
+    repo = StubRepository(gate=gate)
+    service = MusicService(repo, prefetch_tracks=True)
+    try:
+        service._prefetch_song_details(f'v{i}' for i in range(music.MAX_PREFETCH_QUEUE * 2))
+        assert len(service._prefetching) == music.MAX_PREFETCH_QUEUE
+    finally:
+        service.shutdown()
+        gate.set()
+
+
+def test_cached_results_are_copies():
+    repo = StubRepository()
+    service = MusicService(repo, prefetch_tracks=True)
+    service.get_song_details('v1')['views'] = 'MUTATED'
+    cached = service.get_song_details('v1')
+    cached['views'] = 'MUTATED'
+    assert service.get_song_details('v1')['views'] == 1
+    assert repo.song_calls == ['v1']
+
+
+def test_expired_tracks_are_prefetched_again():
+    repo = StubRepository()
+    service = MusicService(repo, prefetch_tracks=True)
+    original_ttl = music.SONG_CACHE_TTL
+    try:
+        service.get_album_details('a0')
+        wait_for_prefetch(service)
+        assert len(repo.song_calls) == 3
+        music.SONG_CACHE_TTL = -1
+        service.get_album_details('a0')
+        wait_for_prefetch(service)
+        assert len(repo.song_calls) == 6
+    finally:
+        music.SONG_CACHE_TTL = original_ttl
+        service.shutdown()
+
+
+def test_partial_failures_are_not_cached():
+    repo = StubRepository()
+    original = repo.get_song_details
+    repo.get_song_details = lambda video_id: {**original(video_id), 'lyrics': music.LYRICS_FETCH_FAILED}
+    service = MusicService(repo, prefetch_tracks=True)
+    service.get_song_details('v1')
+    service.get_song_details('v1')
+    assert repo.song_calls == ['v1', 'v1']
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name}: ok")
@@ -35,6 +35,14 @@ def test_features():
         artist_details['albums'] = f"Found {len(artist_details['albums'])} albums"
     print_result("Artist Details", artist_details)
 
+    # 2b. Crawl the full discography
+    print(f"\n2b. Crawling discography for artist {artist_id}...")
+    discography = youtube_music.get_artist_discography(artist_id)
+    for kind in ['albums', 'singles']:
+        if kind in discography:
+            discography[kind] = f"Found {len(discography[kind])} {kind}"
+    print_result("Artist Discography", discography)
+
     # 3. Search for an Album
     print("\n3. Searching for album 'OK Computer'...")
     album_results = youtube_music.search_music("OK Computer", limit=1, filter_type="albums")